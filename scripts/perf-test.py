@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = []
+# dependencies = ["orjson", "msgspec"]
 # ///
 """
 Semfora Engine Performance Test Suite
@@ -24,20 +24,34 @@ Alternative (direct execution if UV is in PATH):
 """
 
 import argparse
+import functools
+import itertools
 import json
+import math
+import multiprocessing
 import os
 import platform
+import select
 import shutil
 import subprocess
 import sys
-import tempfile
+import threading
 import time
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-import statistics
+
+# Fast JSON (available when run via uv); fall back to stdlib for direct execution
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # ============================================================================
 # Configuration
@@ -60,11 +74,30 @@ LARGE_REPOS = ["next.js", "typescript-eslint", "babel", "puppeteer", "playwright
 # Query patterns for benchmarking
 SEARCH_PATTERNS = ["function", "export", "handler", "error", "async", "render", "parse", "interface"]
 
+# CPU pinning (--pin, Linux-only): populated in main(). Pinning engine
+# processes to fixed CPUs (and capping rayon to one thread) lowers
+# run-to-run stddev, so fewer iterations give trustworthy numbers. For best
+# results also run `cpupower frequency-set -g performance` (not required).
+_PIN_CPUS: list[int] = []
+_pin_counter = itertools.count()
+
+def next_pin_cpu() -> Optional[int]:
+    """Next CPU to pin an engine process to, or None when pinning is off"""
+    if not _PIN_CPUS:
+        return None
+    return _PIN_CPUS[next(_pin_counter) % len(_PIN_CPUS)]
+
+def pinned_child_env() -> Optional[dict]:
+    """Environment for pinned engine processes (single rayon thread)"""
+    if not _PIN_CPUS:
+        return None
+    return {**os.environ, "RAYON_NUM_THREADS": "1"}
+
 # ============================================================================
 # Data Structures (Google Benchmark compatible)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Single benchmark result - Google Benchmark compatible"""
     name: str
@@ -79,7 +112,7 @@ class BenchmarkResult:
     error: Optional[str] = None
     metadata: dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkContext:
     """System context - Google Benchmark compatible"""
     date: str
@@ -97,16 +130,23 @@ class BenchmarkContext:
     rust_version: str = ""
     engine_version: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkReport:
     """Full report - Google Benchmark compatible structure"""
     context: BenchmarkContext
     benchmarks: list  # List of BenchmarkResult
 
     def to_dict(self):
+        # Shallow per-field copies: dataclasses.asdict recursively
+        # deep-copies every container, which adds noticeable overhead and
+        # GC churn across hundreds of results. All fields here are
+        # primitives plus one flat metadata dict, so shallow is safe.
         return {
-            "context": asdict(self.context),
-            "benchmarks": [asdict(b) for b in self.benchmarks]
+            "context": {f: getattr(self.context, f) for f in BenchmarkContext.__slots__},
+            "benchmarks": [
+                {f: getattr(b, f) for f in BenchmarkResult.__slots__}
+                for b in self.benchmarks
+            ],
         }
 
 # ============================================================================
@@ -115,22 +155,23 @@ class BenchmarkReport:
 
 def get_system_context() -> BenchmarkContext:
     """Gather system information"""
+    # Batch git + rustc into a single shell probe: one fork instead of two
     git_commit = ""
-    try:
-        git_commit = subprocess.check_output(
-            ["git", "rev-parse", "--short", "HEAD"],
-            cwd=PROJECT_DIR, stderr=subprocess.DEVNULL
-        ).decode().strip()
-    except Exception:
-        pass  # Git info is optional context
-
     rust_version = ""
     try:
-        rust_version = subprocess.check_output(
-            ["rustc", "--version"], stderr=subprocess.DEVNULL
-        ).decode().strip()
+        probe = subprocess.run(
+            ["sh", "-c",
+             'printf "git:%s\\n" "$(git rev-parse --short HEAD 2>/dev/null)"; '
+             'printf "rustc:%s\\n" "$(rustc --version 2>/dev/null)"'],
+            cwd=PROJECT_DIR, capture_output=True, text=True, timeout=10
+        )
+        for line in probe.stdout.splitlines():
+            if line.startswith("git:"):
+                git_commit = line[4:].strip()
+            elif line.startswith("rustc:"):
+                rust_version = line[6:].strip()
     except Exception:
-        pass  # Rust version is optional context
+        pass  # Git/Rust info is optional context (no sh on Windows)
 
     engine_version = ""
     try:
@@ -143,15 +184,19 @@ def get_system_context() -> BenchmarkContext:
     except Exception:
         pass  # Engine version is optional context
 
+    # Two syscalls instead of parsing /proc/meminfo (which may be masked in containers)
     memory_gb = 0.0
     try:
-        with open("/proc/meminfo") as f:
-            for line in f:
-                if line.startswith("MemTotal:"):
-                    memory_gb = int(line.split()[1]) / 1024 / 1024
-                    break
-    except Exception:
-        pass  # Memory info unavailable on some platforms
+        memory_gb = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 ** 3)
+    except (AttributeError, ValueError, OSError):
+        try:
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemTotal:"):
+                        memory_gb = int(line.split()[1]) / 1024 / 1024
+                        break
+        except Exception:
+            pass  # Memory info unavailable on some platforms
 
     return BenchmarkContext(
         date=datetime.now().isoformat(),
@@ -195,21 +240,70 @@ def find_repos(category: str = "all") -> list[tuple[str, Path]]:
 
     return repos
 
-def count_source_files(path: Path) -> int:
-    """Count source files in a directory"""
-    extensions = {'.ts', '.tsx', '.js', '.jsx', '.rs', '.py', '.go', '.java', '.c', '.cpp', '.h', '.hpp'}
+# Skip common non-source directories when counting files
+SKIP_DIRS = frozenset({'node_modules', '.git', 'target', '__pycache__', 'dist', 'build'})
+SOURCE_EXTS = frozenset({'.ts', '.tsx', '.js', '.jsx', '.rs', '.py', '.go', '.java', '.c', '.cpp', '.h', '.hpp'})
+
+def _count_files_under(root: str) -> int:
+    """Count source files under one directory tree (os.scandir stack walk)
+
+    The DirEntry carries a cached stat, and string-slicing the suffix
+    avoids allocating a Path per file (os.walk plus Path(f).suffix does
+    both, which is measurable on large repos).
+    """
+    stack = [root]
+    count = 0
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    else:
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot >= 0 and name[dot:].lower() in SOURCE_EXTS:
+                            count += 1
+        except OSError:
+            pass  # Return partial count on error
+    return count
+
+@functools.lru_cache(maxsize=None)
+def _count_cached(path_str: str, mtime_ns: int) -> int:
+    """Memoized walk: the sequential and parallel phases size the same repos"""
+    subdirs = []
     count = 0
     try:
-        for root, dirs, files in os.walk(path):
-            # Skip common non-source directories
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'target', '__pycache__', 'dist', 'build'}]
-            for f in files:
-                if Path(f).suffix.lower() in extensions:
-                    count += 1
-    except Exception:
-        pass  # Return partial count on error
+        with os.scandir(path_str) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                else:
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot >= 0 and name[dot:].lower() in SOURCE_EXTS:
+                        count += 1
+    except OSError:
+        return count
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(len(subdirs), 8)) as executor:
+            count += sum(executor.map(_count_files_under, subdirs))
     return count
 
+def count_source_files(path: Path) -> int:
+    """Count source files in a directory
+
+    Results are cached on (path, top-level mtime): repos are not modified
+    between the sequential and parallel phases, so the second walk is free.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+    return _count_cached(str(path), mtime_ns)
+
 def get_index_size(path: Path) -> int:
     """Get the size of the .semfora_index directory in bytes"""
     index_path = path / ".semfora_index"
@@ -235,21 +329,46 @@ def clear_cache(repo_path: Path) -> bool:
     except Exception:
         return False
 
-def run_with_timing(cmd: list[str], timeout: int = 300, cwd: Path = None) -> tuple[float, bool, str]:
+def run_with_timing(cmd: list[str], timeout: int = 300, cwd: Path = None, discard_stdout: bool = False) -> tuple[float, bool, str]:
     """Run command and return (duration_seconds, success, output)
 
     Args:
         cmd: Command to run
         timeout: Timeout in seconds
         cwd: Working directory to run command in (most commands operate on current dir)
+        discard_stdout: Send stdout to /dev/null, keeping only bounded stderr.
+            Use on paths that never parse the output: buffering and decoding
+            a multi-MB stdout inflates both the measured time and Python RSS.
     """
+    cpu = next_pin_cpu()
+    env = pinned_child_env()
     start = time.perf_counter()
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, cwd=str(cwd) if cwd else None)
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL if discard_stdout else subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(cwd) if cwd else None,
+            env=env,
+        )
+        if cpu is not None:
+            # Pin after spawn (as DaemonClient.start does): preexec_fn runs
+            # between fork and exec and can deadlock when callers sit in
+            # ThreadPoolExecutor workers, as the stress test's do
+            try:
+                os.sched_setaffinity(proc.pid, {cpu})
+            except OSError:
+                pass  # child may already have exited
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return timeout, False, "Timeout"
         duration = time.perf_counter() - start
-        return duration, result.returncode == 0, result.stdout + result.stderr
-    except subprocess.TimeoutExpired:
-        return timeout, False, "Timeout"
+        if discard_stdout:
+            return duration, proc.returncode == 0, stderr[:2000].decode(errors="replace")
+        return duration, proc.returncode == 0, (stdout + stderr).decode(errors="replace")
     except Exception as e:
         return time.perf_counter() - start, False, str(e)
 
@@ -264,12 +383,226 @@ def get_memory_usage_mb() -> float:
         pass  # /proc unavailable on some platforms
     return 0.0
 
+def _mean(values) -> float:
+    """Arithmetic mean (samples here are tiny; stdlib statistics is overkill)"""
+    return sum(values) / len(values)
+
+def _stdev(values) -> float:
+    """Sample standard deviation; 0.0 for fewer than two samples
+
+    statistics.stdev accumulates in Fraction for precision -- wildly more
+    than N=5 timing samples need, and importing statistics pulls in
+    fractions at startup.
+    """
+    n = len(values)
+    if n < 2:
+        return 0.0
+    m = sum(values) / n
+    return math.sqrt(sum((x - m) * (x - m) for x in values) / (n - 1))
+
+def write_json_report(data: dict, path: Path):
+    """Write a JSON report, using orjson when available (2-10x faster serialization)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
 def print_progress(msg: str, color: str = "blue"):
     """Print colored progress message"""
     colors = {"blue": "\033[94m", "green": "\033[92m", "yellow": "\033[93m", "red": "\033[91m", "cyan": "\033[96m"}
     reset = "\033[0m"
     print(f"{colors.get(color, '')}{msg}{reset}")
 
+# ============================================================================
+# Daemon RPC Client (persistent engine session)
+# ============================================================================
+
+class DaemonClient:
+    """Long-lived engine session speaking MCP JSON-RPC over stdio.
+
+    Forking a fresh engine process per query means process startup (execve,
+    dynamic linking, index load) dominates sub-second measurements. A single
+    persistent `semfora-engine serve` child lets us time only the
+    request/response round-trip. Use --cold-start to keep the old
+    one-process-per-query path when startup cost is what you want to measure.
+    """
+
+    #: Per-RPC deadline, matching the timeouts the replaced subprocess.run
+    #: calls enforced; one wedged daemon must not hang the whole suite
+    RPC_TIMEOUT = 60.0
+
+    def __init__(self):
+        self.proc: Optional[subprocess.Popen] = None
+        self._next_id = 0
+        self._buf = b""
+        # Reuse one encoder/decoder per client: JSON framing is on the
+        # critical path of every timed RPC
+        if msgspec is not None:
+            self._encode = msgspec.json.Encoder().encode
+            self._decode = msgspec.json.Decoder().decode
+            self._decode_error = msgspec.DecodeError
+        else:
+            self._encode = lambda obj: json.dumps(obj).encode()
+            self._decode = json.loads
+            self._decode_error = json.JSONDecodeError
+
+    def start(self) -> "DaemonClient":
+        self.proc = subprocess.Popen(
+            [str(ENGINE_BIN), "serve", "--no-watch", "--no-git-poll"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=pinned_child_env(),
+        )
+        cpu = next_pin_cpu()
+        if cpu is not None:
+            try:
+                os.sched_setaffinity(self.proc.pid, {cpu})
+            except OSError:
+                pass  # child may already have exited; the handshake reports that
+        self._rpc("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "semfora-perf-test", "version": "1.0"},
+        })
+        self._notify("notifications/initialized", {})
+        return self
+
+    def close(self):
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+        self.proc = None
+
+    def __enter__(self) -> "DaemonClient":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _send(self, msg: dict):
+        self.proc.stdin.write(self._encode(msg) + b"\n")
+        self.proc.stdin.flush()
+
+    def _notify(self, method: str, params: dict):
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _read_line(self, deadline: float) -> bytes:
+        """Read one newline-terminated frame, honoring the deadline
+
+        Reads the raw fd via select + os.read instead of readline: a
+        buffered readline blocks indefinitely if the daemon wedges without
+        closing stdout. Returns b"" on EOF; raises TimeoutError when the
+        deadline passes first.
+        """
+        fd = self.proc.stdout.fileno()
+        while b"\n" not in self._buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Engine daemon RPC timed out")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                raise TimeoutError("Engine daemon RPC timed out")
+            chunk = os.read(fd, 64 * 1024)
+            if not chunk:
+                return b""
+            self._buf += chunk
+        line, _, self._buf = self._buf.partition(b"\n")
+        return line + b"\n"
+
+    def _rpc(self, method: str, params: dict, timeout: float = RPC_TIMEOUT) -> dict:
+        self._next_id += 1
+        req_id = self._next_id
+        self._send({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params})
+        deadline = time.monotonic() + timeout
+        while True:
+            line = self._read_line(deadline)
+            if not line:
+                raise RuntimeError("Engine daemon closed its stdout")
+            try:
+                msg = self._decode(line)
+            except self._decode_error:
+                continue  # Skip any non-JSON noise on stdout
+            if msg.get("id") == req_id:
+                return msg
+
+    def call(self, tool: str, arguments: dict) -> tuple[bool, str]:
+        """Call an MCP tool and return (success, text output)
+
+        A timed-out RPC is surfaced as a failed call, mirroring how the
+        per-process path reported subprocess timeouts.
+        """
+        try:
+            msg = self._rpc("tools/call", {"name": tool, "arguments": arguments})
+        except TimeoutError as e:
+            return False, str(e)
+        if "error" in msg:
+            return False, str(msg["error"])
+        result = msg.get("result", {})
+        text = "".join(c.get("text", "") for c in result.get("content", []))
+        return not result.get("isError", False), text
+
+
+class DaemonClientPool:
+    """One DaemonClient per worker thread, created lazily and closed together.
+
+    Thread pools reuse threads across tasks, so `threading.local` gives each
+    worker its own persistent engine session instead of one process per task.
+    """
+
+    def __init__(self):
+        self._tls = threading.local()
+        self._clients: list[DaemonClient] = []
+        self._keyed: dict[str, DaemonClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> DaemonClient:
+        client = getattr(self._tls, "client", None)
+        if client is None:
+            client = DaemonClient().start()
+            self._tls.client = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def get_for(self, key: str) -> DaemonClient:
+        """Dedicated client per key (one per repo), shared across threads.
+
+        Routing all of a repo's queries to the same session keeps that
+        repo's index resident in one worker across benchmark phases, so
+        everything after the first query measures the warm steady state.
+        """
+        with self._lock:
+            client = self._keyed.get(key)
+        if client is not None:
+            return client
+        fresh = DaemonClient().start()  # Start outside the lock: spawns are slow
+        with self._lock:
+            client = self._keyed.get(key)
+            if client is None:
+                self._keyed[key] = fresh
+                self._clients.append(fresh)
+                return fresh
+        fresh.close()  # Lost the race; another thread registered one first
+        return client
+
+    def close_all(self):
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.close()
+
+    def __enter__(self) -> "DaemonClientPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.close_all()
+
 # ============================================================================
 # Benchmark Functions - Updated for new CLI
 # ============================================================================
@@ -285,7 +618,7 @@ def benchmark_index_repo(args: tuple[str, Path, bool]) -> BenchmarkResult:
 
     # Use new CLI: index generate <path>
     cmd = [str(ENGINE_BIN), "index", "generate", str(path), "--format", "toon"]
-    duration, success, output = run_with_timing(cmd)
+    duration, success, output = run_with_timing(cmd, discard_stdout=True)
 
     # Get index size after generation
     index_size = get_index_size(path)
@@ -304,7 +637,7 @@ def benchmark_index_repo(args: tuple[str, Path, bool]) -> BenchmarkResult:
         }
     )
 
-def benchmark_search(args: tuple[str, Path, str, str, int]) -> BenchmarkResult:
+def benchmark_search(args: tuple[str, Path, str, str, int], client: Optional[DaemonClient] = None) -> BenchmarkResult:
     """Run search query benchmark using new CLI"""
     repo_name, repo_path, pattern, mode, iterations = args
 
@@ -312,6 +645,21 @@ def benchmark_search(args: tuple[str, Path, str, str, int]) -> BenchmarkResult:
     result_counts = []
 
     for _ in range(iterations):
+        if client is not None:
+            # Persistent daemon: time only the RPC round-trip
+            start = time.perf_counter()
+            success, output = client.call("search", {
+                "query": pattern,
+                "mode": mode,
+                "limit": 20,
+                "path": str(repo_path),
+            })
+            duration = time.perf_counter() - start
+            if success:
+                times.append(duration)
+            continue
+
+        # Cold-start path: one engine process per query
         # Use new CLI: search <pattern> [--symbols|--related] (operates on current dir)
         # mode should be "symbols" or "semantic"
         mode_flag = "--symbols" if mode == "symbols" else "--related"
@@ -335,10 +683,11 @@ def benchmark_search(args: tuple[str, Path, str, str, int]) -> BenchmarkResult:
             real_time=0,
             error="All iterations failed"
         )
+    includes_startup = client is None
 
     return BenchmarkResult(
         name=f"search_{mode}/{repo_name}/{pattern}",
-        real_time=statistics.mean(times),
+        real_time=_mean(times),
         iterations=len(times),
         metadata={
             "pattern": pattern,
@@ -346,70 +695,89 @@ def benchmark_search(args: tuple[str, Path, str, str, int]) -> BenchmarkResult:
             "mode": mode,
             "min": round(min(times), 4),
             "max": round(max(times), 4),
-            "stddev": round(statistics.stdev(times), 4) if len(times) > 1 else 0,
-            "avg_results": round(statistics.mean(result_counts), 1) if result_counts else 0,
+            "stddev": round(_stdev(times), 4),
+            "avg_results": round(_mean(result_counts), 1) if result_counts else 0,
+            "includes_startup": includes_startup,
         }
     )
 
-def benchmark_get_overview(repo_name: str, repo_path: Path, iterations: int = 10) -> BenchmarkResult:
-    """Benchmark get_overview operation using new CLI"""
-    times = []
-    token_counts = []
-
-    for _ in range(iterations):
-        # Use new CLI: query overview (operates on current dir)
-        cmd = [str(ENGINE_BIN), "query", "overview", "--format", "toon"]
-        duration, success, output = run_with_timing(cmd, timeout=30, cwd=repo_path)
-        if success:
-            times.append(duration)
-            # Estimate token count (4 chars per token approximation)
-            token_counts.append(len(output) // 4)
+def benchmark_search_batch(repo_name: str, repo_path: Path, patterns: list[str],
+                           iterations: int, client: Optional[DaemonClient] = None) -> list[BenchmarkResult]:
+    """Run every search pattern for one repo through a single engine session
 
-    if not times:
-        return BenchmarkResult(name=f"overview/{repo_name}", real_time=0, error="Failed")
+    The common cost of per-(repo, pattern) tasks is re-loading the index,
+    not the pattern match. Batching a repo's whole pattern set into one
+    session pays that cost once, so per-query times reflect warm steady
+    state; with --cold-start (client=None) each query still forks and the
+    includes_startup metadata flag records the difference.
+    """
+    results = []
+    for pattern in patterns:
+        # Test both symbol and semantic search modes
+        for mode in ("symbols", "semantic"):
+            results.append(benchmark_search((repo_name, repo_path, pattern, mode, iterations), client=client))
+    return results
 
-    return BenchmarkResult(
-        name=f"overview/{repo_name}",
-        real_time=statistics.mean(times),
-        iterations=len(times),
-        metadata={
-            "min": round(min(times), 4),
-            "max": round(max(times), 4),
-            "avg_tokens": round(statistics.mean(token_counts), 0) if token_counts else 0,
-        }
-    )
+def _estimate_tokens(output: str) -> int:
+    """Estimate token count (4 chars per token approximation)"""
+    return len(output) // 4
 
-def benchmark_get_call_graph(repo_name: str, repo_path: Path, iterations: int = 10) -> BenchmarkResult:
-    """Benchmark call graph retrieval using new CLI"""
+def _extract_edge_count(output: str) -> Optional[int]:
+    """Pull an edge count out of JSON callgraph output (None for TOON)"""
+    try:
+        data = json.loads(output)
+        if "edge_count" in data:
+            return data["edge_count"]
+        if "edges" in data:
+            return len(data["edges"])
+    except (json.JSONDecodeError, TypeError, KeyError):
+        pass  # Edge count is optional metadata
+    return None
+
+# Single-shot query ops, previously two near-identical benchmark functions:
+# (result prefix, MCP tool, extra tool args, CLI suffix, timeout,
+#  metadata key, output -> metadata value)
+QUERY_OPS = [
+    ("overview", "get_overview", {},
+     ["query", "overview", "--format", "toon"], 30,
+     "avg_tokens", _estimate_tokens),
+    ("call_graph", "get_callgraph", {"summary_only": True},
+     ["query", "callgraph", "--format", "json", "--stats-only"], 60,
+     "avg_edges", _extract_edge_count),
+]
+
+def benchmark_query_op(spec: tuple, repo_name: str, repo_path: Path, iterations: int = 10,
+                       client: Optional[DaemonClient] = None) -> BenchmarkResult:
+    """Run one QUERY_OPS entry against a repo (daemon session or cold CLI)"""
+    op, tool, tool_args, cmd_suffix, timeout, meta_key, extract = spec
     times = []
-    edge_counts = []
+    values = []
 
     for _ in range(iterations):
-        # Use new CLI: query callgraph --stats-only (operates on current dir)
-        cmd = [str(ENGINE_BIN), "query", "callgraph", "--format", "json", "--stats-only"]
-        duration, success, output = run_with_timing(cmd, timeout=60, cwd=repo_path)
+        if client is not None:
+            start = time.perf_counter()
+            success, output = client.call(tool, {"path": str(repo_path), **tool_args})
+            duration = time.perf_counter() - start
+        else:
+            cmd = [str(ENGINE_BIN)] + cmd_suffix
+            duration, success, output = run_with_timing(cmd, timeout=timeout, cwd=repo_path)
         if success:
             times.append(duration)
-            try:
-                data = json.loads(output)
-                if "edge_count" in data:
-                    edge_counts.append(data["edge_count"])
-                elif "edges" in data:
-                    edge_counts.append(len(data["edges"]))
-            except (json.JSONDecodeError, TypeError, KeyError):
-                pass  # Edge count is optional metadata
+            value = extract(output)
+            if value is not None:
+                values.append(value)
 
     if not times:
-        return BenchmarkResult(name=f"call_graph/{repo_name}", real_time=0, error="Failed")
+        return BenchmarkResult(name=f"{op}/{repo_name}", real_time=0, error="Failed")
 
     return BenchmarkResult(
-        name=f"call_graph/{repo_name}",
-        real_time=statistics.mean(times),
+        name=f"{op}/{repo_name}",
+        real_time=_mean(times),
         iterations=len(times),
         metadata={
             "min": round(min(times), 4),
             "max": round(max(times), 4),
-            "avg_edges": round(statistics.mean(edge_counts), 0) if edge_counts else 0,
+            meta_key: round(_mean(values), 0) if values else 0,
         }
     )
 
@@ -421,14 +789,14 @@ def benchmark_validation(repo_name: str, repo_path: Path, iterations: int = 5) -
     times = []
     for _ in range(iterations):
         cmd = [str(ENGINE_BIN), "validate", "--duplicates", "--format", "json", "--limit", "50"]
-        duration, success, output = run_with_timing(cmd, timeout=120, cwd=repo_path)
+        duration, success, output = run_with_timing(cmd, timeout=120, cwd=repo_path, discard_stdout=True)
         if success:
             times.append(duration)
 
     if times:
         results.append(BenchmarkResult(
             name=f"validate_duplicates/{repo_name}",
-            real_time=statistics.mean(times),
+            real_time=_mean(times),
             iterations=len(times),
             metadata={"min": round(min(times), 4), "max": round(max(times), 4)}
         ))
@@ -437,14 +805,14 @@ def benchmark_validation(repo_name: str, repo_path: Path, iterations: int = 5) -
     times = []
     for _ in range(iterations):
         cmd = [str(ENGINE_BIN), "validate", "--format", "json", "--limit", "100"]
-        duration, success, output = run_with_timing(cmd, timeout=120, cwd=repo_path)
+        duration, success, output = run_with_timing(cmd, timeout=120, cwd=repo_path, discard_stdout=True)
         if success:
             times.append(duration)
 
     if times:
         results.append(BenchmarkResult(
             name=f"validate_complexity/{repo_name}",
-            real_time=statistics.mean(times),
+            real_time=_mean(times),
             iterations=len(times),
             metadata={"min": round(min(times), 4), "max": round(max(times), 4)}
         ))
@@ -458,7 +826,7 @@ def benchmark_diff_analysis(repo_name: str, repo_path: Path, iterations: int = 5
     for _ in range(iterations):
         # Analyze diff against HEAD~1 (if available) - operates on current dir
         cmd = [str(ENGINE_BIN), "analyze", "--diff", "HEAD~1", "--format", "json"]
-        duration, success, output = run_with_timing(cmd, timeout=60, cwd=repo_path)
+        duration, success, output = run_with_timing(cmd, timeout=60, cwd=repo_path, discard_stdout=True)
         if success:
             times.append(duration)
 
@@ -467,7 +835,7 @@ def benchmark_diff_analysis(repo_name: str, repo_path: Path, iterations: int = 5
 
     return BenchmarkResult(
         name=f"diff_analysis/{repo_name}",
-        real_time=statistics.mean(times),
+        real_time=_mean(times),
         iterations=len(times),
         metadata={"min": round(min(times), 4), "max": round(max(times), 4)}
     )
@@ -479,7 +847,7 @@ def benchmark_cache_performance(repo_name: str, repo_path: Path) -> list[Benchma
     # Cold cache (clear first)
     clear_cache(repo_path)
     cmd = [str(ENGINE_BIN), "query", "overview", "--format", "toon"]
-    cold_time, cold_success, _ = run_with_timing(cmd, timeout=60, cwd=repo_path)
+    cold_time, cold_success, _ = run_with_timing(cmd, timeout=60, cwd=repo_path, discard_stdout=True)
 
     if cold_success:
         results.append(BenchmarkResult(
@@ -492,18 +860,18 @@ def benchmark_cache_performance(repo_name: str, repo_path: Path) -> list[Benchma
     # Warm cache (index should exist now)
     warm_times = []
     for _ in range(5):
-        duration, success, _ = run_with_timing(cmd, timeout=30, cwd=repo_path)
+        duration, success, _ = run_with_timing(cmd, timeout=30, cwd=repo_path, discard_stdout=True)
         if success:
             warm_times.append(duration)
 
     if warm_times:
         results.append(BenchmarkResult(
             name=f"cache_warm/{repo_name}",
-            real_time=statistics.mean(warm_times),
+            real_time=_mean(warm_times),
             iterations=len(warm_times),
             metadata={
                 "type": "warm_cache",
-                "speedup": round(cold_time / statistics.mean(warm_times), 2) if cold_time > 0 else 0,
+                "speedup": round(cold_time / _mean(warm_times), 2) if cold_time > 0 else 0,
             }
         ))
 
@@ -529,7 +897,7 @@ def benchmark_query_module(repo_name: str, repo_path: Path, iterations: int = 10
     for _ in range(iterations):
         # query module <NAME> (operates on current dir)
         cmd = [str(ENGINE_BIN), "query", "module", module_name, "--format", "toon"]
-        duration, success, _ = run_with_timing(cmd, timeout=30, cwd=repo_path)
+        duration, success, _ = run_with_timing(cmd, timeout=30, cwd=repo_path, discard_stdout=True)
         if success:
             times.append(duration)
 
@@ -538,11 +906,23 @@ def benchmark_query_module(repo_name: str, repo_path: Path, iterations: int = 10
 
     return BenchmarkResult(
         name=f"query_module/{repo_name}",
-        real_time=statistics.mean(times),
+        real_time=_mean(times),
         iterations=len(times),
         metadata={"module": module_name, "min": round(min(times), 4), "max": round(max(times), 4)}
     )
 
+def warm_indexes(repos: list[tuple[str, Path]]):
+    """Generate indexes for all repos concurrently (not timed)"""
+    def warm_one(repo: tuple[str, Path]):
+        _, path = repo
+        subprocess.run(
+            [str(ENGINE_BIN), "index", "generate", str(path), "--format", "toon"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(len(repos), 8)) as executor:
+        list(executor.map(warm_one, repos))
+
 # ============================================================================
 # Test Suites
 # ============================================================================
@@ -560,15 +940,23 @@ def run_indexing_benchmarks(repos: list[tuple[str, Path]], parallel: bool = True
     print_progress("Phase 1: Sequential indexing (baseline)...", "yellow")
     seq_start = time.perf_counter()
 
+    # Keep the timed loop pure measurement: stdout writes (lock, flush)
+    # between benchmarks would leak into seq_total
+    seq_results = []
     for name, path in repos:
-        result = benchmark_index_repo((name, path, True))
+        seq_results.append(benchmark_index_repo((name, path, True)))
+
+    seq_total = time.perf_counter() - seq_start
+
+    status_lines = []
+    for result in seq_results:
         results.append(result)
         status = "✓" if not result.error else "✗"
         index_size = result.metadata.get('index_size_kb')
         size_str = f", {index_size:.0f}KB" if index_size is not None else ""
-        print(f"  {status} {name}: {result.real_time:.2f}s ({result.items_per_second:.0f} files/s{size_str})")
-
-    seq_total = time.perf_counter() - seq_start
+        status_lines.append(f"  {status} {result.metadata.get('repo', result.name)}: {result.real_time:.2f}s ({result.items_per_second:.0f} files/s{size_str})")
+    sys.stdout.write("\n".join(status_lines) + "\n")
+    sys.stdout.flush()
     results.append(BenchmarkResult(
         name="indexing/sequential_total",
         real_time=seq_total,
@@ -585,12 +973,22 @@ def run_indexing_benchmarks(repos: list[tuple[str, Path]], parallel: bool = True
 
         par_start = time.perf_counter()
 
-        with ProcessPoolExecutor(max_workers=min(len(repos), os.cpu_count() or 4)) as executor:
+        # forkserver workers start from a small preloaded template process:
+        # cheaper than spawn (full re-import per worker on macOS/Windows) and
+        # than fork (copies the loaded interpreter's page tables)
+        try:
+            mp_ctx = multiprocessing.get_context("forkserver")
+            mp_ctx.set_forkserver_preload(["subprocess", "time", "pathlib"])
+        except ValueError:
+            mp_ctx = None  # forkserver is Unix-only; fall back to the platform default
+
+        with ProcessPoolExecutor(max_workers=min(len(repos), os.cpu_count() or 4), mp_context=mp_ctx) as executor:
             futures = {
                 executor.submit(benchmark_index_repo, (name, path, False)): name
                 for name, path in repos
             }
 
+            status_lines = []
             for future in as_completed(futures):
                 name = futures[future]
                 try:
@@ -598,11 +996,13 @@ def run_indexing_benchmarks(repos: list[tuple[str, Path]], parallel: bool = True
                     result.name = f"indexing_parallel/{result.metadata.get('repo', name)}"
                     results.append(result)
                     status = "✓" if not result.error else "✗"
-                    print(f"  {status} {name}: {result.real_time:.2f}s")
+                    status_lines.append(f"  {status} {name}: {result.real_time:.2f}s")
                 except Exception as e:
-                    print(f"  ✗ {name}: {e}")
+                    status_lines.append(f"  ✗ {name}: {e}")
 
         par_total = time.perf_counter() - par_start
+        sys.stdout.write("\n".join(status_lines) + "\n")
+        sys.stdout.flush()
         speedup = seq_total / par_total if par_total > 0 else 1.0
 
         results.append(BenchmarkResult(
@@ -617,7 +1017,7 @@ def run_indexing_benchmarks(repos: list[tuple[str, Path]], parallel: bool = True
 
     return results
 
-def run_query_benchmarks(repos: list[tuple[str, Path]], iterations: int = 5) -> list[BenchmarkResult]:
+def run_query_benchmarks(repos: list[tuple[str, Path]], iterations: int = 5, cold_start: bool = False) -> list[BenchmarkResult]:
     """Run query benchmarks"""
     results = []
 
@@ -626,52 +1026,50 @@ def run_query_benchmarks(repos: list[tuple[str, Path]], iterations: int = 5) ->
     print_progress(f"  Repos: {len(repos)}, Iterations: {iterations}")
     print_progress(f"{'='*60}\n")
 
-    # Ensure repos are indexed first
+    # Ensure repos are indexed first (concurrently: wall time is max(indexing)
+    # across repos instead of sum)
     print_progress("Ensuring indexes exist...", "yellow")
-    for name, path in repos:
-        cmd = [str(ENGINE_BIN), "index", "generate", str(path), "--format", "toon"]
-        subprocess.run(cmd, capture_output=True)
+    warm_indexes(repos)
 
-    # Build list of all search benchmarks to run in parallel
-    search_tasks = []
-    for name, path in repos:
-        for pattern in SEARCH_PATTERNS[:4]:  # Use subset for speed
-            # Test both symbol and semantic search modes
-            search_tasks.append((name, path, pattern, "symbols", iterations))
-            search_tasks.append((name, path, pattern, "semantic", iterations))
+    # One batch task per repo: all patterns run against the same warm session
+    patterns = SEARCH_PATTERNS[:4]  # Use subset for speed
+    print_progress(f"Running {len(repos) * len(patterns) * 2} search benchmarks ({len(repos)} repo batches)...", "yellow")
 
-    print_progress(f"Running {len(search_tasks)} search benchmarks in parallel...", "yellow")
+    with DaemonClientPool() as pool:
+        def run_repo_batch(repo: tuple[str, Path]) -> list[BenchmarkResult]:
+            name, path = repo
+            client = None if cold_start else pool.get_for(name)
+            return benchmark_search_batch(name, path, patterns, iterations, client=client)
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = [executor.submit(benchmark_search, task) for task in search_tasks]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(run_repo_batch, repo) for repo in repos]
 
-        for future in as_completed(futures):
-            try:
-                result = future.result()
+            for future in as_completed(futures):
+                try:
+                    for result in future.result():
+                        results.append(result)
+                        if result.error:
+                            print(f"  ✗ {result.name}: {result.error}")
+                        else:
+                            print(f"  ✓ {result.name}: {result.real_time*1000:.1f}ms")
+                except Exception as e:
+                    print(f"  ✗ Error: {e}")
+
+        # Overview, call graph, and module benchmarks reuse each repo's
+        # session from the search phase, so they hit an already-warm index
+        print_progress("\nRunning overview/callgraph/module benchmarks...", "yellow")
+        for name, path in repos[:3]:  # Limit to 3 repos
+            repo_client = None if cold_start else pool.get_for(name)
+            for spec in QUERY_OPS:
+                result = benchmark_query_op(spec, name, path, iterations, client=repo_client)
                 results.append(result)
-                if result.error:
-                    print(f"  ✗ {result.name}: {result.error}")
-                else:
-                    print(f"  ✓ {result.name}: {result.real_time*1000:.1f}ms")
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-
-    # Overview, call graph, and module benchmarks
-    print_progress("\nRunning overview/callgraph/module benchmarks...", "yellow")
-    for name, path in repos[:3]:  # Limit to 3 repos
-        result = benchmark_get_overview(name, path, iterations)
-        results.append(result)
-        tokens = result.metadata.get('avg_tokens', 0)
-        print(f"  ✓ overview/{name}: {result.real_time*1000:.1f}ms (~{tokens:.0f} tokens)")
-
-        result = benchmark_get_call_graph(name, path, iterations)
-        results.append(result)
-        edges = result.metadata.get('avg_edges', 0)
-        print(f"  ✓ call_graph/{name}: {result.real_time*1000:.1f}ms (~{edges:.0f} edges)")
+                meta_key = spec[5]
+                extra = result.metadata.get(meta_key, 0)
+                print(f"  ✓ {result.name}: {result.real_time*1000:.1f}ms (~{extra:.0f} {meta_key.removeprefix('avg_')})")
 
-        result = benchmark_query_module(name, path, iterations)
-        results.append(result)
-        print(f"  ✓ query_module/{name}: {result.real_time*1000:.1f}ms")
+            result = benchmark_query_module(name, path, iterations)
+            results.append(result)
+            print(f"  ✓ query_module/{name}: {result.real_time*1000:.1f}ms")
 
     return results
 
@@ -726,7 +1124,8 @@ def run_cache_benchmarks(repos: list[tuple[str, Path]]) -> list[BenchmarkResult]
 
     return results
 
-def run_stress_test(repos: list[tuple[str, Path]], num_queries: int = 100) -> list[BenchmarkResult]:
+def run_stress_test(repos: list[tuple[str, Path]], num_queries: int = 100, cold_start: bool = False,
+                    seed: int = 0xC0FFEE) -> list[BenchmarkResult]:
     """Run concurrent query stress test"""
     results = []
 
@@ -736,42 +1135,88 @@ def run_stress_test(repos: list[tuple[str, Path]], num_queries: int = 100) -> li
     print_progress(f"{'='*60}\n")
 
     # Ensure indexes exist
-    for _, path in repos:
-        subprocess.run([str(ENGINE_BIN), "index", "generate", str(path), "--format", "toon"], capture_output=True)
+    warm_indexes(repos)
 
     print_progress(f"Running {num_queries} concurrent queries...", "yellow")
 
+    import asyncio
     import random
 
-    def random_query(_):
-        name, path = random.choice(repos)
-        pattern = random.choice(SEARCH_PATTERNS)
-        flag = random.choice(["--symbols", "--related"])
-        cmd = [str(ENGINE_BIN), "search", pattern, flag, "--limit", "20"]
-        start = time.perf_counter()
-        try:
-            subprocess.run(cmd, capture_output=True, timeout=30, cwd=path)
-            return time.perf_counter() - start, True
-        except Exception:
-            return time.perf_counter() - start, False
-
-    start_time = time.perf_counter()
-
-    with ThreadPoolExecutor(max_workers=16) as executor:
-        query_results = list(executor.map(random_query, range(num_queries)))
+    # Precompute the full query plan with a seeded RNG: no contention on the
+    # shared random instance inside the worker loops, and the same seed
+    # reproduces the same plan for CI regression comparisons
+    rng = random.Random(seed)
+    plan = [
+        (rng.choice(repos), rng.choice(SEARCH_PATTERNS), rng.choice(("symbols", "semantic")))
+        for _ in range(num_queries)
+    ]
+
+    # monotonic_ns keeps per-sample timing in integer nanoseconds: no
+    # float conversion in the hot loop, no rounding drift in min/max
+
+    if cold_start:
+        # One event loop waits on all children via the OS poller instead of
+        # parking a thread (and its stack) in wait4 per concurrent query --
+        # scales to hundreds of in-flight queries on a single thread
+        async def cold_query(sem: asyncio.Semaphore, task: tuple) -> tuple[int, bool]:
+            async with sem:
+                (name, path), pattern, mode = task
+                flag = "--symbols" if mode == "symbols" else "--related"
+                start = time.monotonic_ns()
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        str(ENGINE_BIN), "search", pattern, flag, "--limit", "20",
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL,
+                        cwd=path,
+                    )
+                    ok = (await asyncio.wait_for(proc.wait(), timeout=30)) == 0
+                    return time.monotonic_ns() - start, ok
+                except Exception:
+                    return time.monotonic_ns() - start, False
+
+        async def run_cold_queries() -> list[tuple[int, bool]]:
+            sem = asyncio.Semaphore(16)
+            return await asyncio.gather(*(cold_query(sem, task) for task in plan))
+
+        start_time = time.perf_counter()
+        query_results = asyncio.run(run_cold_queries())
+        total_time = time.perf_counter() - start_time
+    else:
+        # Persistent per-worker daemon sessions: time only the RPC round-trip
+        pool = DaemonClientPool()
 
-    total_time = time.perf_counter() - start_time
+        def random_query(task):
+            (name, path), pattern, mode = task
+            client = pool.get()
+            start = time.monotonic_ns()
+            try:
+                success, _ = client.call("search", {
+                    "query": pattern, "mode": mode, "limit": 20, "path": str(path),
+                })
+                return time.monotonic_ns() - start, success
+            except Exception:
+                return time.monotonic_ns() - start, False
+
+        start_time = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                query_results = list(executor.map(random_query, plan))
+        finally:
+            pool.close_all()
+        total_time = time.perf_counter() - start_time
 
-    successful = [t for t, ok in query_results if ok]
-    failed = num_queries - len(successful)
+    # Aggregate in integer nanoseconds; convert to ms/s only for reporting
+    successful_ns = [t for t, ok in query_results if ok]
+    failed = num_queries - len(successful_ns)
 
     qps = num_queries / total_time if total_time > 0 else 0
-    avg_latency = statistics.mean(successful) if successful else 0
+    avg_latency_ms = sum(successful_ns) / len(successful_ns) / 1e6 if successful_ns else 0
 
     print_progress(f"\n  Total time:    {total_time:.2f}s", "green")
     print_progress(f"  Queries/sec:   {qps:.1f}", "green")
-    print_progress(f"  Avg latency:   {avg_latency*1000:.1f}ms", "green")
-    print_progress(f"  Success rate:  {len(successful)}/{num_queries}", "green")
+    print_progress(f"  Avg latency:   {avg_latency_ms:.1f}ms", "green")
+    print_progress(f"  Success rate:  {len(successful_ns)}/{num_queries}", "green")
 
     results.append(BenchmarkResult(
         name="stress/concurrent_queries",
@@ -779,12 +1224,13 @@ def run_stress_test(repos: list[tuple[str, Path]], num_queries: int = 100) -> li
         iterations=num_queries,
         items_per_second=qps,
         metadata={
-            "avg_latency_ms": round(avg_latency * 1000, 2),
-            "min_latency_ms": round(min(successful) * 1000, 2) if successful else 0,
-            "max_latency_ms": round(max(successful) * 1000, 2) if successful else 0,
-            "p95_latency_ms": round(sorted(successful)[int(len(successful) * 0.95)] * 1000, 2) if len(successful) >= 1 else 0,
-            "success_count": len(successful),
-            "failure_count": failed
+            "avg_latency_ms": round(avg_latency_ms, 2),
+            "min_latency_ms": round(min(successful_ns) / 1e6, 2) if successful_ns else 0,
+            "max_latency_ms": round(max(successful_ns) / 1e6, 2) if successful_ns else 0,
+            "p95_latency_ms": round(sorted(successful_ns)[int(len(successful_ns) * 0.95)] / 1e6, 2) if len(successful_ns) >= 1 else 0,
+            "success_count": len(successful_ns),
+            "failure_count": failed,
+            "seed": seed
         }
     ))
 
@@ -810,17 +1256,14 @@ def run_self_benchmark() -> list[BenchmarkResult]:
     results.append(result)
     print(f"  ✓ Index: {result.real_time:.2f}s ({result.items_per_second:.0f} files/s, {result.metadata.get('index_size_kb', 0):.0f}KB)")
 
-    # Overview
-    print_progress("Overview query...", "yellow")
-    result = benchmark_get_overview(repo_name, repo_path, 10)
-    results.append(result)
-    print(f"  ✓ Overview: {result.real_time*1000:.1f}ms (~{result.metadata.get('avg_tokens', 0):.0f} tokens)")
-
-    # Call graph
-    print_progress("Call graph query...", "yellow")
-    result = benchmark_get_call_graph(repo_name, repo_path, 10)
-    results.append(result)
-    print(f"  ✓ Call graph: {result.real_time*1000:.1f}ms (~{result.metadata.get('avg_edges', 0):.0f} edges)")
+    # Overview and call graph
+    for spec in QUERY_OPS:
+        print_progress(f"{spec[0].replace('_', ' ').title()} query...", "yellow")
+        result = benchmark_query_op(spec, repo_name, repo_path, 10)
+        results.append(result)
+        meta_key = spec[5]
+        extra = result.metadata.get(meta_key, 0)
+        print(f"  ✓ {result.name}: {result.real_time*1000:.1f}ms (~{extra:.0f} {meta_key.removeprefix('avg_')})")
 
     # Search benchmarks
     print_progress("Search benchmarks...", "yellow")
@@ -915,7 +1358,9 @@ def generate_html_report(report: BenchmarkReport, output_path: Path, comparison_
             categories[cat] = []
         categories[cat].append(b)
 
-    html = f"""<!DOCTYPE html>
+    # Build the document as a list of parts and join once: += on a growing
+    # string is O(N^2) in the number of benchmarks
+    parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Semfora Performance Report - {report.context.date[:10]}</title>
@@ -976,19 +1421,20 @@ def generate_html_report(report: BenchmarkReport, output_path: Path, comparison_
                 </div>
             </div>
         </div>
-"""
+"""]
 
     if comparison_text:
-        html += f"""
+        parts.append(f"""
         <div class="card">
             <h2>Comparison vs Baseline</h2>
             <pre>{comparison_text}</pre>
         </div>
-"""
+""")
 
-    # Add sections for each category
-    for cat, benchmarks in categories.items():
-        html += f"""
+    # Add sections for each category (sorted for deterministic order)
+    for cat in sorted(categories):
+        benchmarks = categories[cat]
+        parts.append(f"""
         <div class="card">
             <h2>{cat.replace('_', ' ').title()} Benchmarks</h2>
             <table>
@@ -999,13 +1445,13 @@ def generate_html_report(report: BenchmarkReport, output_path: Path, comparison_
                     <th>Throughput</th>
                     <th>Status</th>
                 </tr>
-"""
+""")
         for b in benchmarks:
             time_str = f"{b.real_time:.3f}s" if b.real_time >= 1 else f"{b.real_time*1000:.1f}ms"
             throughput = f"{b.items_per_second:.1f}/s" if b.items_per_second > 0 else "-"
             status = '<span class="error">✗</span>' if b.error else '<span class="success">✓</span>'
 
-            html += f"""
+            parts.append(f"""
                 <tr>
                     <td>{b.name}</td>
                     <td>{time_str}</td>
@@ -1013,19 +1459,19 @@ def generate_html_report(report: BenchmarkReport, output_path: Path, comparison_
                     <td>{throughput}</td>
                     <td>{status}</td>
                 </tr>
-"""
-        html += """
+""")
+        parts.append("""
             </table>
         </div>
-"""
+""")
 
-    html += """
+    parts.append("""
     </div>
 </body>
 </html>
-"""
+""")
 
-    output_path.write_text(html)
+    output_path.write_text("".join(parts))
     print_progress(f"\nHTML report: {output_path}", "green")
 
 # ============================================================================
@@ -1071,11 +1517,23 @@ def main():
     parser.add_argument("--cache-only", action="store_true", help="Run only cache performance benchmarks")
     parser.add_argument("--stress-only", action="store_true", help="Run only stress test")
     parser.add_argument("--no-build", action="store_true", help="Skip cargo build")
+    parser.add_argument("--cold-start", action="store_true", help="Spawn a fresh engine process per query (measures startup cost)")
+    parser.add_argument("--pin", action="store_true", help="Pin engine processes to fixed CPUs to reduce variance (Linux only)")
+    parser.add_argument("--seed", type=int, default=0xC0FFEE, help="RNG seed for the stress-test query plan (reproducible runs)")
     parser.add_argument("--report", action="store_true", help="Generate HTML report from latest results")
     parser.add_argument("--compare", action="store_true", help="Compare against previous run")
     parser.add_argument("--output", type=str, help="Output JSON file path")
     args = parser.parse_args()
 
+    if args.pin:
+        if hasattr(os, "sched_getaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+            # Leave the first CPU to the orchestrator so its bookkeeping
+            # doesn't share a core with a pinned engine
+            _PIN_CPUS.extend(cpus[1:] if len(cpus) > 1 else cpus)
+        else:
+            print_progress("--pin requires sched_setaffinity (Linux); ignoring", "yellow")
+
     # Setup directories
     HISTORY_DIR.mkdir(parents=True, exist_ok=True)
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -1144,20 +1602,20 @@ def main():
     elif args.indexing_only:
         all_results.extend(run_indexing_benchmarks(repos))
     elif args.queries_only:
-        all_results.extend(run_query_benchmarks(repos[:5]))
+        all_results.extend(run_query_benchmarks(repos[:5], cold_start=args.cold_start))
     elif args.validation_only:
         all_results.extend(run_validation_benchmarks(repos[:3]))
     elif args.cache_only:
         all_results.extend(run_cache_benchmarks(repos[:3]))
     elif args.stress_only:
-        all_results.extend(run_stress_test(repos[:5]))
+        all_results.extend(run_stress_test(repos[:5], cold_start=args.cold_start, seed=args.seed))
     else:
         # Run all
         all_results.extend(run_indexing_benchmarks(repos))
-        all_results.extend(run_query_benchmarks(repos[:5]))
+        all_results.extend(run_query_benchmarks(repos[:5], cold_start=args.cold_start))
         all_results.extend(run_validation_benchmarks(repos[:3]))
         all_results.extend(run_cache_benchmarks(repos[:3]))
-        all_results.extend(run_stress_test(repos[:5]))
+        all_results.extend(run_stress_test(repos[:5], cold_start=args.cold_start, seed=args.seed))
 
     # Create report
     report = BenchmarkReport(context=context, benchmarks=all_results)
@@ -1169,15 +1627,13 @@ def main():
         print(comparison_text)
 
     # Save JSON to history
+    report_dict = report.to_dict()
     history_path = HISTORY_DIR / f"perf_{timestamp}.json"
-    with open(history_path, "w") as f:
-        json.dump(report.to_dict(), f, indent=2)
+    write_json_report(report_dict, history_path)
 
     # Also save to custom output if specified
     if args.output:
-        output_path = Path(args.output)
-        with open(output_path, "w") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        write_json_report(report_dict, Path(args.output))
 
     print_progress(f"\n{'='*60}")
     print_progress("  COMPLETE")
@@ -33,16 +33,23 @@ Note: File-save detection via daemon file watcher is faster than CLI-based testi
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
-import random
+import re
+import secrets
+import select
 import shutil
-import string
 import subprocess
 import sys
 import tempfile
 import time
-from dataclasses import dataclass, field, asdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -65,7 +72,8 @@ DEFAULT_REPOS = [
 ]
 
 # Polling configuration
-POLL_INTERVAL_MS = 50  # Check every 50ms
+POLL_INTERVAL_MS = 50  # Initial poll interval
+MAX_POLL_INTERVAL_MS = 500  # Backoff cap - keeps late polls cheap without hurting latency much
 MAX_POLL_TIME_MS = 30000  # Give up after 30 seconds
 SETTLE_TIME_MS = 100  # Wait before starting to poll
 
@@ -121,11 +129,29 @@ class TestSummary:
 
 def generate_unique_id() -> str:
     """Generate a unique identifier for test artifacts"""
-    timestamp = int(time.time() * 1000)
-    rand = ''.join(random.choices(string.ascii_lowercase, k=4))
-    return f"test_{timestamp}_{rand}"
-
-def run_cmd(cmd: list[str], cwd: Optional[Path] = None, timeout: int = 60) -> tuple[bool, str, str]:
+    # monotonic_ns never repeats within a process (unlike ms-resolution
+    # wall time under fast iteration); token_hex guards across processes
+    return f"test_{time.monotonic_ns()}_{secrets.token_hex(3)}"
+
+# Resolved once so subprocess calls skip the per-invocation PATH search
+GIT_BIN = shutil.which("git") or "git"
+
+# Minimal child env, built once and reused for every subprocess. The git
+# overrides point global/system config at /dev/null so git skips loading
+# user config (which can carry slow includes, hooks, or gpg settings);
+# the test commit supplies its identity via -c flags.
+_CHILD_ENV = {
+    "PATH": os.environ.get("PATH", ""),
+    "HOME": os.environ.get("HOME", ""),
+}
+_GIT_ENV = {
+    **_CHILD_ENV,
+    "GIT_CONFIG_GLOBAL": "/dev/null",
+    "GIT_CONFIG_SYSTEM": "/dev/null",
+}
+
+def run_cmd(cmd: list[str], cwd: Optional[Path] = None, timeout: int = 60,
+            env: Optional[dict] = None) -> tuple[bool, str, str]:
     """Run command and return (success, stdout, stderr)"""
     try:
         result = subprocess.run(
@@ -133,7 +159,8 @@ def run_cmd(cmd: list[str], cwd: Optional[Path] = None, timeout: int = 60) -> tu
             capture_output=True,
             text=True,
             timeout=timeout,
-            cwd=cwd
+            cwd=cwd,
+            env=env if env is not None else _CHILD_ENV
         )
         return result.returncode == 0, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
@@ -141,6 +168,10 @@ def run_cmd(cmd: list[str], cwd: Optional[Path] = None, timeout: int = 60) -> tu
     except Exception as e:
         return False, "", str(e)
 
+def git_cmd(args: list[str], cwd: Path, timeout: int = 60) -> tuple[bool, str, str]:
+    """Run git with the pre-resolved binary and config lookups disabled"""
+    return run_cmd([GIT_BIN] + args, cwd=cwd, timeout=timeout, env=_GIT_ENV)
+
 def engine_cmd(args: list[str], repo_path: Path, timeout: int = 120) -> tuple[bool, str]:
     """Run semfora-engine command"""
     cmd = [str(ENGINE_BIN)] + args + ["--dir", str(repo_path)]
@@ -159,61 +190,214 @@ def print_status(msg: str, color: str = "blue"):
     reset = "\033[0m"
     print(f"{colors.get(color, '')}{msg}{reset}")
 
-def ensure_index(repo_path: Path) -> bool:
-    """Ensure repo has an index, create if missing"""
+# Directories never worth descending into when looking for test files
+PRUNE_DIRS = {"node_modules", ".git", "__tests__", "tests"}
+
+# Files we must not pick as mutation targets
+EXCLUDED_DIRS = frozenset({"node_modules", "__tests__", "tests"})
+EXCLUDED_SUFFIXES = (".d.ts", ".test.ts", ".test.tsx", ".spec.ts")
+
+def find_source_files(repo_path: Path, limit: int = 1, valid=None) -> list[Path]:
+    """Find up to `limit` candidate source files in a single walk
+
+    Replaces repo-wide glob("**/*.ts") scans: the walk prunes excluded
+    directories in place (so node_modules is never descended into) and
+    returns as soon as enough files are found. Falls back to JS files
+    when the repo has no TypeScript.
+    """
+    found = []
+    for exts in ((".ts", ".tsx"), (".js", ".jsx")):
+        for dirpath, dirnames, filenames in os.walk(repo_path):
+            dirnames[:] = [d for d in dirnames if d not in PRUNE_DIRS]
+            for name in filenames:
+                if not name.endswith(exts):
+                    continue
+                f = Path(dirpath) / name
+                if valid is not None and not valid(f):
+                    continue
+                found.append(f)
+                if len(found) >= limit:
+                    return found
+        if found:
+            break
+    return found
+
+def _engine_fingerprint() -> str:
+    """Identify the current engine build, for invalidating cached probes"""
+    try:
+        st = ENGINE_BIN.stat()
+    except OSError:
+        return ""
+    return hashlib.sha1(f"{st.st_mtime_ns}:{ENGINE_BIN}".encode()).hexdigest()
+
+def ensure_index(repo_path: Path, force_check: bool = False) -> bool:
+    """Ensure repo has an index, create if missing
+
+    A successful probe is recorded in a .semfora_test_cache sidecar keyed
+    by the engine binary (path + mtime), so repeat runs against warm repos
+    skip the --cache-info fork entirely; rebuilding the engine invalidates
+    the sidecar automatically. --force-index-check bypasses it.
+    """
+    sidecar = repo_path / ".semfora_test_cache"
+    fingerprint = _engine_fingerprint()
+
+    if not force_check and fingerprint:
+        try:
+            if sidecar.read_text().strip() == fingerprint:
+                return True
+        except OSError:
+            pass
+
     success, output = engine_cmd(["--cache-info"], repo_path)
     if "No cache" in output or not success:
         print_status(f"  Creating index for {repo_path.name}...", "yellow")
         success, _ = engine_cmd(["--shard", "--format", "toon"], repo_path, timeout=300)
-        return success
+        if not success:
+            return False
+
+    if fingerprint:
+        try:
+            sidecar.write_text(fingerprint + "\n")
+        except OSError:
+            pass
     return True
 
 # ============================================================================
 # Detection Functions
 # ============================================================================
 
-def search_symbol(repo_path: Path, symbol_name: str) -> tuple[bool, Optional[str]]:
-    """Search for a symbol by name, return (found, hash)"""
-    success, output = engine_cmd(["--search-symbols", symbol_name, "--limit", "50"], repo_path)
+def engine_cmd_multi(queries: list[list[str]], repo_path: Path, timeout: int = 120) -> list[tuple[bool, str]]:
+    """Run a batch of engine queries through a single funnel.
+
+    Every EngineSession.send goes through here. The engine CLI has no
+    batch or REPL mode yet, so each query still costs its own fork +
+    index load; once the engine can answer several queries per
+    invocation, only this helper needs to change to collapse a batch
+    into one process.
+    """
+    return [engine_cmd(args, repo_path, timeout=timeout) for args in queries]
+
+class EngineSession:
+    """Per-repo handle for the queries a detection test issues
+
+    Ideally this would hold one long-lived engine process and write
+    queries down a pipe, amortizing the fork + index load that dominates
+    each poll cycle. The CLI has no such stdio daemon mode yet (`serve`
+    speaks MCP and answers from its own in-memory index, which would
+    bypass the on-disk reindex path these tests exercise), so send() and
+    find() fall back to one process per call; when an engine-side daemon
+    mode lands, only this class needs to change.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+
+    def __enter__(self) -> "EngineSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def send(self, args: list[str], timeout: int = 120) -> tuple[bool, str]:
+        """Run one engine query against this session's repo"""
+        (result,) = engine_cmd_multi([args], self.repo_path, timeout=timeout)
+        return result
+
+    def find(self, args: list[str], needle: bytes, timeout: int = 120) -> bool:
+        """Run one engine query, reporting whether its output contains needle"""
+        return engine_cmd_find(args, self.repo_path, needle, timeout=timeout)
+
+    def close(self) -> None:
+        """Release the session (no-op until a real daemon mode exists)"""
+
+@functools.lru_cache(maxsize=128)
+def _symbol_hash_pattern(symbol_name: str) -> re.Pattern:
+    """Compiled pattern matching a 16-char hex hash on the symbol's line
+
+    Cached because the poll loop parses the same symbol's search output
+    dozens of times per detection test.
+    """
+    return re.compile(rf"{re.escape(symbol_name)}.*?\b([0-9a-f]{{16}})\b")
+
+def _parse_symbol_search(success: bool, output: str, symbol_name: str) -> tuple[bool, Optional[str]]:
+    """Extract (found, hash) from --search-symbols output"""
     if not success:
         return False, None
 
-    # Parse output to find our symbol
-    # Output format varies, look for the symbol name
+    # Output format varies, look for the symbol name and a hash after it
     if symbol_name in output:
-        # Try to extract hash from output
-        for line in output.split('\n'):
-            if symbol_name in line:
-                # Look for hash pattern (hex string)
-                parts = line.split()
-                for part in parts:
-                    if len(part) == 16 and all(c in '0123456789abcdef' for c in part):
-                        return True, part
+        match = _symbol_hash_pattern(symbol_name).search(output)
+        if match:
+            return True, match.group(1)
         return True, None  # Found but couldn't extract hash
     return False, None
 
-def check_call_graph_for_symbol(repo_path: Path, symbol_hash: Optional[str], symbol_name: str) -> bool:
-    """Check if symbol appears in call graph (as caller or callee)"""
-    success, output = engine_cmd(["--get-call-graph"], repo_path)
-    if not success:
+def engine_cmd_find(args: list[str], repo_path: Path, needle: bytes, timeout: int = 120) -> bool:
+    """Run an engine command and report whether its output contains needle
+
+    Streams stdout in up-to-64KiB chunks instead of buffering the whole
+    output (call graphs run to many megabytes on large repos) and kills
+    the process as soon as the needle is seen. A tail of the previous
+    chunk is kept so a needle split across a chunk boundary still
+    matches. Reads go through select + os.read on the raw fd so the
+    timeout holds even when the engine stalls without emitting output -
+    a buffered read would block until 64KiB accumulate or EOF.
+    """
+    cmd = [str(ENGINE_BIN)] + args + ["--dir", str(repo_path)]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                env=_CHILD_ENV)
+    except Exception:
         return False
 
-    # If we have the hash, look for it directly
-    if symbol_hash and symbol_hash in output:
-        return True
+    found = False
+    carry = b""
+    deadline = time.monotonic() + timeout
+    fd = proc.stdout.fileno()
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break  # deadline passed with the engine producing nothing
+            chunk = os.read(fd, 64 * 1024)
+            if not chunk:
+                break
+            if needle in carry + chunk:
+                found = True
+                break
+            # Fold the chunk into the carry before trimming: os.read can
+            # return fewer than len(needle)-1 bytes, and a needle may
+            # straddle several short reads
+            carry = (carry + chunk)[-(len(needle) - 1):] if len(needle) > 1 else b""
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
 
-    # Otherwise, the call graph contains hashes, not names
-    # We can't directly search by name in the call graph
-    # But if the symbol exists and has calls, it should be there
-    return symbol_hash is not None and symbol_hash in output
+    return found
+
+def check_call_graph_for_symbol(repo_path: Path, symbol_hash: Optional[str], symbol_name: str,
+                                session: Optional[EngineSession] = None) -> bool:
+    """Check if symbol appears in call graph (as caller or callee)"""
+    # The call graph stores hashes, not names: without a hash the answer
+    # is False no matter what the engine returns, so don't ask it
+    if not symbol_hash:
+        return False
+    session = session or EngineSession(repo_path)
+    return session.find(["--get-call-graph"], symbol_hash.encode())
 
 def poll_for_detection(
     repo_path: Path,
     symbol_name: str,
     check_call_graph: bool = True,
-    max_time_ms: int = MAX_POLL_TIME_MS
+    max_time_ms: int = MAX_POLL_TIME_MS,
+    session: Optional[EngineSession] = None
 ) -> DetectionResult:
     """Poll until symbol (and optionally call graph) is detected"""
+    session = session or EngineSession(repo_path)
     start_time = time.perf_counter()
     poll_count = 0
     symbol_detected = False
@@ -221,6 +405,7 @@ def poll_for_detection(
     call_graph_detected = False
     call_graph_time = None
     symbol_hash = None
+    poll_interval = POLL_INTERVAL_MS / 1000
 
     # Initial settle time
     time.sleep(SETTLE_TIME_MS / 1000)
@@ -235,7 +420,8 @@ def poll_for_detection(
 
         # Check symbol
         if not symbol_detected:
-            found, hash_val = search_symbol(repo_path, symbol_name)
+            found, hash_val = _parse_symbol_search(
+                *session.send(["--search-symbols", symbol_name, "--limit", "50"]), symbol_name)
             if found:
                 symbol_detected = True
                 symbol_time = elapsed_ms
@@ -243,7 +429,7 @@ def poll_for_detection(
 
         # Check call graph (only if symbol detected and we have hash)
         if check_call_graph and symbol_detected and not call_graph_detected:
-            if check_call_graph_for_symbol(repo_path, symbol_hash, symbol_name):
+            if check_call_graph_for_symbol(repo_path, symbol_hash, symbol_name, session=session):
                 call_graph_detected = True
                 call_graph_time = elapsed_ms
 
@@ -251,7 +437,10 @@ def poll_for_detection(
         if symbol_detected and (not check_call_graph or call_graph_detected):
             break
 
-        time.sleep(POLL_INTERVAL_MS / 1000)
+        # Exponential backoff: fast changes still resolve on the early
+        # 50ms polls, slow reindexes stop burning a fork every 50ms
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 1.6, MAX_POLL_INTERVAL_MS / 1000)
 
     total_time = (time.perf_counter() - start_time) * 1000
 
@@ -273,7 +462,8 @@ def poll_for_detection(
 # Test Scenarios
 # ============================================================================
 
-def test_file_save_detection(repo_path: Path, iterations: int = 3) -> list[DetectionResult]:
+def test_file_save_detection(repo_path: Path, iterations: int = 3,
+                             session: Optional[EngineSession] = None) -> list[DetectionResult]:
     """
     Test: Add a new function to a file, trigger reindex, measure detection time
 
@@ -281,29 +471,18 @@ def test_file_save_detection(repo_path: Path, iterations: int = 3) -> list[Detec
     In production, the daemon's file watcher handles this automatically.
     """
     results = []
+    session = session or EngineSession(repo_path)
 
-    # Find a suitable TypeScript/JavaScript file to modify
+    # Find a suitable TypeScript/JavaScript file to modify.
+    # Path component checks against a frozenset replace the repeated
+    # full-path substring scans (which also mismatched on Windows
+    # separators); one endswith call covers all suffix exclusions.
     def is_valid_file(f: Path) -> bool:
-        s = str(f)
-        name = f.name.lower()
-        # Exclude node_modules, test files, type definitions
-        if "node_modules" in s:
-            return False
-        if ".d.ts" in name:
+        if EXCLUDED_DIRS.intersection(f.parts):
             return False
-        if name.endswith(".test.ts") or name.endswith(".test.tsx") or name.endswith(".spec.ts"):
-            return False
-        if "/__tests__/" in s or "/tests/" in s:
-            return False
-        return True
+        return not f.name.lower().endswith(EXCLUDED_SUFFIXES)
 
-    test_files = list(repo_path.glob("**/*.ts")) + list(repo_path.glob("**/*.tsx"))
-    test_files = [f for f in test_files if is_valid_file(f)]
-
-    # If no TS files, try JS
-    if not test_files:
-        test_files = list(repo_path.glob("**/*.js")) + list(repo_path.glob("**/*.jsx"))
-        test_files = [f for f in test_files if is_valid_file(f)]
+    test_files = find_source_files(repo_path, limit=1, valid=is_valid_file)
 
     if not test_files:
         print_status(f"  No suitable test files found in {repo_path.name}", "yellow")
@@ -315,8 +494,9 @@ def test_file_save_detection(repo_path: Path, iterations: int = 3) -> list[Detec
         unique_id = generate_unique_id()
         func_name = f"semforaTestFunc_{unique_id}"
 
-        # Read original content
-        original_content = test_file.read_text()
+        # Read original content as raw bytes - the content is opaque to the
+        # test, so skip the utf-8 decode/encode round-trip
+        original_content = test_file.read_bytes()
 
         # Create test function that calls something (for call graph)
         test_code = f'''
@@ -325,11 +505,11 @@ export function {func_name}() {{
     console.log("test");
     return Date.now();
 }}
-'''
+'''.encode()
 
         try:
             # Add test function to file
-            test_file.write_text(original_content + test_code)
+            test_file.write_bytes(original_content + test_code)
 
             # Record start time
             start_time = time.perf_counter()
@@ -352,7 +532,7 @@ export function {func_name}() {{
                 continue
 
             # Now poll for detection
-            detection = poll_for_detection(repo_path, func_name, check_call_graph=True)
+            detection = poll_for_detection(repo_path, func_name, check_call_graph=True, session=session)
 
             # Combine times
             total_time = reindex_time + detection.total_time_ms
@@ -378,17 +558,19 @@ export function {func_name}() {{
 
         finally:
             # Restore original file
-            test_file.write_text(original_content)
+            test_file.write_bytes(original_content)
 
     return results
 
-def test_incremental_commit_detection(repo_path: Path, iterations: int = 3) -> list[DetectionResult]:
+def test_incremental_commit_detection(repo_path: Path, iterations: int = 3,
+                                      session: Optional[EngineSession] = None) -> list[DetectionResult]:
     """
     Test: Make a commit, run incremental reindex, measure detection time
 
     This tests the --incremental path which uses git SHA comparison.
     """
     results = []
+    session = session or EngineSession(repo_path)
 
     # Check if repo is a git repo
     if not (repo_path / ".git").exists():
@@ -396,8 +578,7 @@ def test_incremental_commit_detection(repo_path: Path, iterations: int = 3) -> l
         return results
 
     # Find a suitable file
-    test_files = list(repo_path.glob("**/*.ts")) + list(repo_path.glob("**/*.tsx"))
-    test_files = [f for f in test_files if "node_modules" not in str(f)]
+    test_files = find_source_files(repo_path, limit=1)
 
     if not test_files:
         return results
@@ -408,22 +589,28 @@ def test_incremental_commit_detection(repo_path: Path, iterations: int = 3) -> l
         unique_id = generate_unique_id()
         func_name = f"semforaCommitTest_{unique_id}"
 
-        original_content = test_file.read_text()
+        original_content = test_file.read_bytes()
         original_head = None
 
         try:
             # Get current HEAD
-            success, stdout, _ = run_cmd(["git", "rev-parse", "HEAD"], cwd=repo_path)
+            success, stdout, _ = git_cmd(["rev-parse", "HEAD"], repo_path)
             if success:
                 original_head = stdout.strip()
 
             # Add test function
-            test_code = f'\nexport function {func_name}() {{ return 42; }}\n'
-            test_file.write_text(original_content + test_code)
-
-            # Stage and commit
-            run_cmd(["git", "add", str(test_file)], cwd=repo_path)
-            run_cmd(["git", "commit", "-m", f"Semfora test commit {unique_id}"], cwd=repo_path)
+            test_code = f'\nexport function {func_name}() {{ return 42; }}\n'.encode()
+            test_file.write_bytes(original_content + test_code)
+
+            # Stage and commit in one git invocation; -am picks up the
+            # tracked test file, and the -c overrides keep gpg signing (which
+            # could prompt and hang to timeout) and identity lookups out
+            git_cmd([
+                "-c", "commit.gpgsign=false",
+                "-c", "user.name=semfora-test",
+                "-c", "user.email=semfora-test@localhost",
+                "commit", "-am", f"Semfora test commit {unique_id}"
+            ], repo_path)
 
             # Record start time
             start_time = time.perf_counter()
@@ -445,7 +632,7 @@ def test_incremental_commit_detection(repo_path: Path, iterations: int = 3) -> l
                 continue
 
             # Poll for detection
-            detection = poll_for_detection(repo_path, func_name, check_call_graph=True)
+            detection = poll_for_detection(repo_path, func_name, check_call_graph=True, session=session)
 
             total_time = reindex_time + detection.total_time_ms
 
@@ -470,11 +657,11 @@ def test_incremental_commit_detection(repo_path: Path, iterations: int = 3) -> l
         finally:
             # Restore: reset to original HEAD
             if original_head:
-                run_cmd(["git", "reset", "--hard", original_head], cwd=repo_path)
+                git_cmd(["reset", "--hard", original_head], repo_path)
             else:
                 # Fallback: just restore file and amend
-                test_file.write_text(original_content)
-                run_cmd(["git", "checkout", "--", str(test_file)], cwd=repo_path)
+                test_file.write_bytes(original_content)
+                git_cmd(["checkout", "--", str(test_file)], repo_path)
 
     return results
 
@@ -489,20 +676,24 @@ def test_git_checkout_detection(repo_path: Path) -> list[DetectionResult]:
     if not (repo_path / ".git").exists():
         return results
 
-    # Get current branch
-    success, stdout, _ = run_cmd(["git", "branch", "--show-current"], cwd=repo_path)
+    # Get current branch (plumbing: fails cleanly on detached HEAD)
+    success, stdout, _ = git_cmd(["symbolic-ref", "--short", "HEAD"], repo_path)
     if not success:
         return results
 
     current_branch = stdout.strip()
 
-    # Get list of branches
-    success, stdout, _ = run_cmd(["git", "branch", "-a"], cwd=repo_path)
+    # List local branches via plumbing - unlike `git branch -a` the output
+    # has no current-branch marker or remotes to strip
+    success, stdout, _ = git_cmd(
+        ["for-each-ref", "--format=%(refname:short)", "refs/heads/"],
+        repo_path
+    )
     if not success:
         return results
 
-    branches = [b.strip().replace("* ", "") for b in stdout.split('\n') if b.strip()]
-    other_branches = [b for b in branches if b != current_branch and not b.startswith("remotes/")]
+    branches = [b for b in stdout.split('\n') if b]
+    other_branches = [b for b in branches if b != current_branch]
 
     if not other_branches:
         print_status(f"  No other branches in {repo_path.name}, skipping checkout test", "yellow")
@@ -514,7 +705,7 @@ def test_git_checkout_detection(repo_path: Path) -> list[DetectionResult]:
         # Checkout other branch
         start_time = time.perf_counter()
 
-        success, _, _ = run_cmd(["git", "checkout", target_branch], cwd=repo_path)
+        success, _, _ = git_cmd(["checkout", target_branch], repo_path)
         if not success:
             return results
 
@@ -541,33 +732,44 @@ def test_git_checkout_detection(repo_path: Path) -> list[DetectionResult]:
 
     finally:
         # Return to original branch
-        run_cmd(["git", "checkout", current_branch], cwd=repo_path)
+        git_cmd(["checkout", current_branch], repo_path)
 
     return results
 
-def test_multi_file_changes(repo_path: Path, num_files: int = 5) -> list[DetectionResult]:
+def test_multi_file_changes(repo_path: Path, num_files: int = 5,
+                            session: Optional[EngineSession] = None) -> list[DetectionResult]:
     """
     Test: Change multiple files simultaneously, measure batch detection time
     """
     results = []
+    session = session or EngineSession(repo_path)
 
     # Find test files
-    test_files = list(repo_path.glob("**/*.ts")) + list(repo_path.glob("**/*.tsx"))
-    test_files = [f for f in test_files if "node_modules" not in str(f)][:num_files]
+    test_files = find_source_files(repo_path, limit=num_files)
 
     if len(test_files) < 2:
         return results
 
     unique_id = generate_unique_id()
     func_names = [f"semforaMulti_{unique_id}_{i}" for i in range(len(test_files))]
-    original_contents = {}
+    original_contents: dict[Path, bytes] = {}
+
+    def _append_test_func(item: tuple[int, tuple[Path, str]]) -> None:
+        i, (test_file, func_name) = item
+        test_code = f'\nexport function {func_name}() {{ return {i}; }}\n'.encode()
+        test_file.write_bytes(original_contents[test_file] + test_code)
 
     try:
-        # Modify all files
-        for i, (test_file, func_name) in enumerate(zip(test_files, func_names)):
-            original_contents[test_file] = test_file.read_text()
-            test_code = f'\nexport function {func_name}() {{ return {i}; }}\n'
-            test_file.write_text(original_contents[test_file] + test_code)
+        # Record every original before touching anything, so the restore in
+        # finally is complete even if one of the parallel writes fails
+        for test_file in test_files:
+            original_contents[test_file] = test_file.read_bytes()
+
+        # Then write all files in parallel - each edit is independent file
+        # I/O, and the point of the test is simultaneous changes
+        with ThreadPoolExecutor(max_workers=len(test_files)) as pool:
+            for _ in pool.map(_append_test_func, enumerate(zip(test_files, func_names))):
+                pass
 
         # Record start time
         start_time = time.perf_counter()
@@ -588,12 +790,13 @@ def test_multi_file_changes(repo_path: Path, num_files: int = 5) -> list[Detecti
             ))
             return results
 
-        # Check how many functions were detected
-        detected_count = 0
-        for func_name in func_names:
-            found, _ = search_symbol(repo_path, func_name)
-            if found:
-                detected_count += 1
+        # Check how many functions were detected - all names share the
+        # unique_id prefix, so one prefix search covers the whole batch
+        prefix = f"semforaMulti_{unique_id}_"
+        success, output = session.send(
+            ["--search-symbols", prefix, "--limit", str(len(func_names) * 2)]
+        )
+        detected_count = sum(1 for func_name in func_names if func_name in output) if success else 0
 
         total_time = (time.perf_counter() - start_time) * 1000
 
@@ -612,9 +815,11 @@ def test_multi_file_changes(repo_path: Path, num_files: int = 5) -> list[Detecti
         ))
 
     finally:
-        # Restore all files
-        for test_file, content in original_contents.items():
-            test_file.write_text(content)
+        # Restore all files in parallel
+        if original_contents:
+            with ThreadPoolExecutor(max_workers=len(original_contents)) as pool:
+                for _ in pool.map(lambda item: item[0].write_bytes(item[1]), original_contents.items()):
+                    pass
 
     return results
 
@@ -622,6 +827,19 @@ def test_multi_file_changes(repo_path: Path, num_files: int = 5) -> list[Detecti
 # Test Runner
 # ============================================================================
 
+def _to_dict(record) -> dict:
+    """Shallow dict of a result/summary dataclass
+
+    dataclasses.asdict recurses and deep-copies every field; these records
+    are flat apart from the metadata dict, which only needs a top-level
+    copy since records are never mutated after collection.
+    """
+    d = record.__dict__.copy()
+    metadata = d.get("metadata")
+    if metadata is not None:
+        d["metadata"] = metadata.copy()
+    return d
+
 def summarize_results(results: list[DetectionResult], test_name: str) -> TestSummary:
     """Create summary statistics from test results"""
     successful = [r for r in results if r.success]
@@ -643,66 +861,112 @@ def summarize_results(results: list[DetectionResult], test_name: str) -> TestSum
         call_graph_success_rate=len(cg_times) / len(successful) if successful else 0
     )
 
-def run_all_tests(repos: list[Path], iterations: int = 3, file_save_only: bool = False, git_ops_only: bool = False) -> dict:
-    """Run all tests and return results"""
+def _run_repo_tests(repo_path: Path, iterations: int, file_save_only: bool, git_ops_only: bool,
+                    force_index_check: bool = False) -> list[DetectionResult]:
+    """Run the full test battery for one repo"""
+    all_results = []
+
+    print_status(f"\n{'='*60}")
+    print_status(f"  Testing: {repo_path.name}")
+    print_status(f"{'='*60}")
+
+    # Ensure index exists
+    if not ensure_index(repo_path, force_check=force_index_check):
+        print_status(f"  Failed to create index for {repo_path.name}", "red")
+        return all_results
+
+    # One session per repo, shared by every test's poll loop
+    session = EngineSession(repo_path)
+
+    # Run tests
+    if not git_ops_only:
+        print_status(f"\n  [1/4] File Save Detection ({iterations} iterations)...", "cyan")
+        results = test_file_save_detection(repo_path, iterations, session=session)
+        all_results.extend(results)
+        for r in results:
+            status = "OK" if r.success else "FAIL"
+            cg_status = "OK" if r.call_graph_detected else "MISS"
+            print(f"    {status}: symbol={r.symbol_detection_ms:.0f}ms, call_graph={cg_status} ({r.call_graph_detection_ms:.0f}ms)" if r.call_graph_detection_ms else f"    {status}: symbol={r.symbol_detection_ms:.0f}ms, call_graph={cg_status}")
+
+        print_status(f"\n  [2/4] Multi-File Changes...", "cyan")
+        results = test_multi_file_changes(repo_path, session=session)
+        all_results.extend(results)
+        for r in results:
+            status = "OK" if r.success else "FAIL"
+            print(f"    {status}: {r.metadata.get('files_changed', 0)} files, {r.total_time_ms:.0f}ms")
+
+    if not file_save_only:
+        print_status(f"\n  [3/4] Incremental Commit Detection ({iterations} iterations)...", "cyan")
+        results = test_incremental_commit_detection(repo_path, iterations, session=session)
+        all_results.extend(results)
+        for r in results:
+            status = "OK" if r.success else "FAIL"
+            print(f"    {status}: {r.total_time_ms:.0f}ms total, reindex={r.metadata.get('reindex_time_ms', 0):.0f}ms")
+
+        print_status(f"\n  [4/4] Git Checkout Detection...", "cyan")
+        results = test_git_checkout_detection(repo_path)
+        all_results.extend(results)
+        for r in results:
+            status = "OK" if r.success else "FAIL"
+            print(f"    {status}: {r.metadata.get('from_branch', '?')} -> {r.metadata.get('to_branch', '?')}, {r.total_time_ms:.0f}ms")
+
+    session.close()
+    return all_results
+
+def _run_one_repo(task: tuple[Path, int, bool, bool, bool]) -> tuple[list[DetectionResult], str]:
+    """Worker entry point: run one repo's battery with its output captured
+
+    Output is buffered and returned so parallel workers don't interleave
+    status lines; the parent prints each repo's log as its future completes.
+    """
+    repo_path, iterations, file_save_only, git_ops_only, force_index_check = task
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        results = _run_repo_tests(repo_path, iterations, file_save_only, git_ops_only,
+                                  force_index_check=force_index_check)
+    return results, buf.getvalue()
+
+def run_all_tests(repos: list[Path], iterations: int = 3, file_save_only: bool = False,
+                  git_ops_only: bool = False, jobs: Optional[int] = None,
+                  force_index_check: bool = False) -> dict:
+    """Run all tests and return results
+
+    Repos share no state (each battery touches only its own repo), so the
+    batteries run in parallel across repos by default; --jobs 1 restores
+    strictly serial execution.
+    """
     all_results = []
     summaries = []
 
+    tasks = []
     for repo_path in repos:
         if not repo_path.exists():
             print_status(f"Repo not found: {repo_path}", "red")
             continue
+        tasks.append((repo_path, iterations, file_save_only, git_ops_only, force_index_check))
 
-        print_status(f"\n{'='*60}")
-        print_status(f"  Testing: {repo_path.name}")
-        print_status(f"{'='*60}")
-
-        # Ensure index exists
-        if not ensure_index(repo_path):
-            print_status(f"  Failed to create index for {repo_path.name}", "red")
-            continue
-
-        # Run tests
-        if not git_ops_only:
-            print_status(f"\n  [1/4] File Save Detection ({iterations} iterations)...", "cyan")
-            results = test_file_save_detection(repo_path, iterations)
+    workers = jobs if jobs else min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            results, log = _run_one_repo(task)
+            sys.stdout.write(log)
             all_results.extend(results)
-            for r in results:
-                status = "OK" if r.success else "FAIL"
-                cg_status = "OK" if r.call_graph_detected else "MISS"
-                print(f"    {status}: symbol={r.symbol_detection_ms:.0f}ms, call_graph={cg_status} ({r.call_graph_detection_ms:.0f}ms)" if r.call_graph_detection_ms else f"    {status}: symbol={r.symbol_detection_ms:.0f}ms, call_graph={cg_status}")
-
-            print_status(f"\n  [2/4] Multi-File Changes...", "cyan")
-            results = test_multi_file_changes(repo_path)
-            all_results.extend(results)
-            for r in results:
-                status = "OK" if r.success else "FAIL"
-                print(f"    {status}: {r.metadata.get('files_changed', 0)} files, {r.total_time_ms:.0f}ms")
-
-        if not file_save_only:
-            print_status(f"\n  [3/4] Incremental Commit Detection ({iterations} iterations)...", "cyan")
-            results = test_incremental_commit_detection(repo_path, iterations)
-            all_results.extend(results)
-            for r in results:
-                status = "OK" if r.success else "FAIL"
-                print(f"    {status}: {r.total_time_ms:.0f}ms total, reindex={r.metadata.get('reindex_time_ms', 0):.0f}ms")
-
-            print_status(f"\n  [4/4] Git Checkout Detection...", "cyan")
-            results = test_git_checkout_detection(repo_path)
-            all_results.extend(results)
-            for r in results:
-                status = "OK" if r.success else "FAIL"
-                print(f"    {status}: {r.metadata.get('from_branch', '?')} -> {r.metadata.get('to_branch', '?')}, {r.total_time_ms:.0f}ms")
-
-    # Create summaries by test type
-    test_types = set(r.test_name for r in all_results)
-    for test_type in test_types:
-        type_results = [r for r in all_results if r.test_name == test_type]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for results, log in executor.map(_run_one_repo, tasks):
+                sys.stdout.write(log)
+                all_results.extend(results)
+
+    # Create summaries by test type, bucketing in a single pass
+    by_type: dict[str, list[DetectionResult]] = defaultdict(list)
+    for r in all_results:
+        by_type[r.test_name].append(r)
+    for test_type, type_results in by_type.items():
         summaries.append(summarize_results(type_results, test_type))
 
     return {
-        "results": [asdict(r) for r in all_results],
-        "summaries": [asdict(s) for s in summaries],
+        "results": [_to_dict(r) for r in all_results],
+        "summaries": [_to_dict(s) for s in summaries],
         "timestamp": datetime.now().isoformat(),
         "repos_tested": [str(r) for r in repos if r.exists()]
     }
@@ -729,27 +993,65 @@ def print_summary(report: dict):
 # Main
 # ============================================================================
 
+def _needs_build() -> bool:
+    """Check whether the release binary is older than its build inputs
+
+    Even a no-op cargo build --release takes seconds to conclude nothing
+    changed; comparing the binary's mtime against the manifests and every
+    file under src/ and queries/ answers the common already-fresh case
+    without invoking cargo at all. src/ and queries/ are scanned whole,
+    not just *.rs: the binary embeds tree-sitter queries and agent
+    templates via include_str!, so a .scm or .md edit must trigger a
+    rebuild too. Errs on the side of building.
+    """
+    try:
+        bin_mtime = ENGINE_BIN.stat().st_mtime_ns
+    except OSError:
+        return True
+
+    newest = 0
+    for manifest in (PROJECT_DIR / "Cargo.toml", PROJECT_DIR / "Cargo.lock"):
+        try:
+            newest = max(newest, manifest.stat().st_mtime_ns)
+        except OSError:
+            return True
+    for root in (PROJECT_DIR / "src", PROJECT_DIR / "queries"):
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                try:
+                    newest = max(newest, os.stat(os.path.join(dirpath, name)).st_mtime_ns)
+                except OSError:
+                    return True
+    return newest > bin_mtime
+
 def main():
     parser = argparse.ArgumentParser(description="Real-World Behavior Tests for Semfora Engine")
     parser.add_argument("--repo", type=Path, action="append", help="Test specific repo(s)")
     parser.add_argument("--iterations", type=int, default=3, help="Iterations per test")
+    parser.add_argument("--jobs", type=int, help="Repos to test in parallel (default: one per CPU, capped at repo count)")
     parser.add_argument("--file-save-only", action="store_true", help="Only run file save tests")
     parser.add_argument("--git-ops-only", action="store_true", help="Only run git operation tests")
+    parser.add_argument("--force-index-check", action="store_true",
+                        help="Probe index state even if a previous run cached it")
     parser.add_argument("--output", type=Path, help="Output JSON file")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON report for human reading")
     parser.add_argument("--no-build", action="store_true", help="Skip cargo build")
     args = parser.parse_args()
 
     # Build if needed
     if not args.no_build:
-        print_status("Building release binary...", "yellow")
-        result = subprocess.run(
-            ["cargo", "build", "--release"],
-            cwd=PROJECT_DIR,
-            capture_output=True
-        )
-        if result.returncode != 0:
-            print_status("Build failed!", "red")
-            sys.exit(1)
+        if _needs_build():
+            print_status("Building release binary...", "yellow")
+            result = subprocess.run(
+                ["cargo", "build", "--release"],
+                cwd=PROJECT_DIR,
+                capture_output=True
+            )
+            if result.returncode != 0:
+                print_status("Build failed!", "red")
+                sys.exit(1)
+        else:
+            print_status("Engine binary up to date, skipping build", "green")
 
     if not ENGINE_BIN.exists():
         print_status(f"Engine binary not found: {ENGINE_BIN}", "red")
@@ -773,7 +1075,9 @@ def main():
         repos,
         iterations=args.iterations,
         file_save_only=args.file_save_only,
-        git_ops_only=args.git_ops_only
+        git_ops_only=args.git_ops_only,
+        jobs=args.jobs,
+        force_index_check=args.force_index_check
     )
 
     # Print summary
@@ -784,8 +1088,13 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = args.output or RESULTS_DIR / f"realworld_{timestamp}.json"
 
+    # Compact separators by default - reports are read by tooling, and
+    # indent=2 roughly doubles the file size and serialization time
     with open(output_path, "w") as f:
-        json.dump(report, f, indent=2)
+        if args.pretty:
+            json.dump(report, f, indent=2, default=str)
+        else:
+            json.dump(report, f, separators=(",", ":"), default=str)
 
     print_status(f"Results saved to: {output_path}", "green")
 